@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Validate the apartment catalog against the Jacksonville service-area rules
+before it is imported into the database.
+Service-area rules are read from src/lib/geo.ts so both tiers agree.
+Writes accepted records, a rejected-records file with the reasons, and a
+report of unit-count outliers (flagged for review, still imported).
+"""
+
+import json
+import math
+import re
+import sys
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+from statistics import median
+
+# Paths
+GEO_TS = Path(__file__).parent.parent / "src" / "lib" / "geo.ts"
+INPUT_JSON = Path(__file__).parent.parent / "tax_roll" / "apartments_final.json"
+OUTPUT_JSON = Path(__file__).parent.parent / "tax_roll" / "apartments_validated.json"
+REJECTED_JSON = Path(__file__).parent.parent / "tax_roll" / "apartments_rejected.json"
+FLAGGED_JSON = Path(__file__).parent.parent / "tax_roll" / "apartments_flagged.json"
+
+# Same limits as the Add Apartment form
+MIN_YEAR_BUILT = 1800
+MAX_YEAR_BUILT = date.today().year
+MIN_UNIT_COUNT = 1
+
+# City variations accepted by validateJacksonvilleAddress
+VALID_CITY_NAMES = frozenset({
+    'jacksonville', 'jax', 'jacksonville beach', 'atlantic beach', 'neptune beach'
+})
+
+# Unit counts this many MADs above their propertyType median are outliers
+OUTLIER_THRESHOLD = 10.0
+# ...and at least this many times the median, so groups of mostly 1-2 unit
+# buildings (MAD of 0 or 1) don't flag every ordinary complex
+OUTLIER_MIN_RATIO = 10.0
+MIN_GROUP_SIZE = 10  # Too few records to judge what is "normal"
+
+# Larger outputs are written compactly; indenting 1M records takes longer
+# than validating them
+PRETTY_PRINT_LIMIT = 10000
+
+
+def load_geo_rules():
+    """Read JACKSONVILLE_ZIP_CODES, JACKSONVILLE_BOUNDS and the state from geo.ts."""
+    source = GEO_TS.read_text(encoding='utf-8')
+
+    zip_block = re.search(r'JACKSONVILLE_ZIP_CODES\s*=\s*\[(.*?)\]', source, re.S)
+    bounds_block = re.search(r'JACKSONVILLE_BOUNDS\s*=\s*\{(.*?)\}', source, re.S)
+    state = re.search(r"JACKSONVILLE_STATE\s*=\s*'(\w+)'", source)
+    if not (zip_block and bounds_block and state):
+        sys.exit(f"Could not read Jacksonville rules from {GEO_TS}")
+
+    zip_codes = frozenset(re.findall(r"'(\d{5})'", zip_block.group(1)))
+    bounds = {
+        key: float(value)
+        for key, value in re.findall(r'(\w+):\s*(-?[\d.]+)', bounds_block.group(1))
+    }
+    return zip_codes, bounds, state.group(1)
+
+
+def to_float(value):
+    """Coerce JSON/CSV numbers ('30.3', 30.3) to float, or None if not finite."""
+    if value is None or value == '':
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def to_int(value):
+    """Coerce JSON/CSV numbers ('98', 98.0, '') to int, or None."""
+    number = to_float(value)
+    return int(number) if number is not None else None
+
+
+def write_json(path, records):
+    """Write records, indented only when small enough to read by hand."""
+    indent = 2 if len(records) <= PRETTY_PRINT_LIMIT else None
+    with open(path, 'w') as f:
+        # dumps() uses the C encoder; dump() streams through the slower Python one
+        f.write(json.dumps(records, indent=indent))
+
+
+def validate(apartments, zip_codes, bounds, state):
+    """
+    Check every record in one pass, then flag unit-count outliers per propertyType.
+    Returns (reasons, warnings): lists aligned with `apartments`. Records with
+    reasons are rejected; warnings only mark them for review.
+    """
+    south, north = bounds['south'], bounds['north']
+    west, east = bounds['west'], bounds['east']
+    state = state.upper()
+
+    reasons = [[] for _ in apartments]
+    warnings = [[] for _ in apartments]
+    units_by_type = defaultdict(list)  # propertyType -> [(index, unitCount)]
+
+    for i, apt in enumerate(apartments):
+        errors = reasons[i]
+
+        if not isinstance(apt, dict):
+            errors.append('record is not an object')
+            continue
+
+        if not apt.get('address'):
+            errors.append('missing address')
+
+        raw_zip = apt.get('zipCode')
+        if isinstance(raw_zip, (int, float)) and to_int(raw_zip) is not None:
+            raw_zip = to_int(raw_zip)  # 32210.0 from a spreadsheet -> 32210
+        zip_code = str(raw_zip or '').split('-')[0].strip()
+        if not zip_code:
+            errors.append('missing zipCode')
+        elif zip_code not in zip_codes:
+            errors.append(f'zipCode {zip_code} is outside the Jacksonville service area')
+
+        apt_state = apt.get('state')
+        if apt_state and str(apt_state).upper() != state:
+            errors.append(f'state {apt_state} is not {state}')
+
+        city = apt.get('city')
+        if city and str(city).lower() not in VALID_CITY_NAMES:
+            errors.append(f'city {city} is outside the Jacksonville area')
+
+        raw_lat, raw_lng = apt.get('latitude'), apt.get('longitude')
+        lat, lng = to_float(raw_lat), to_float(raw_lng)
+        if raw_lat not in (None, '') and lat is None:
+            errors.append(f'latitude {raw_lat} is not a number')
+        elif raw_lng not in (None, '') and lng is None:
+            errors.append(f'longitude {raw_lng} is not a number')
+        elif lat is not None and lng is not None:
+            if not (south <= lat <= north and west <= lng <= east):
+                errors.append('coordinates are outside the Jacksonville service area')
+
+        year_built = apt.get('yearBuilt')
+        if year_built not in (None, ''):
+            year = to_int(year_built)
+            if year is None:
+                errors.append(f'yearBuilt {year_built} is not a number')
+            elif not MIN_YEAR_BUILT <= year <= MAX_YEAR_BUILT:
+                errors.append(f'yearBuilt {year_built} is outside {MIN_YEAR_BUILT}-{MAX_YEAR_BUILT}')
+
+        raw_units = apt.get('unitCount')
+        units = to_int(raw_units)
+        if raw_units in (None, ''):
+            errors.append('missing unitCount')
+        elif units is None:
+            errors.append(f'unitCount {raw_units} is not a number')
+        elif units < MIN_UNIT_COUNT:
+            errors.append(f'unitCount {units} is below {MIN_UNIT_COUNT}')
+        else:
+            units_by_type[apt.get('propertyType') or 'apartment'].append((i, units))
+
+    # Robust z-score (median / MAD) so a few huge complexes don't hide each other
+    for property_type, entries in units_by_type.items():
+        if len(entries) < MIN_GROUP_SIZE:
+            continue
+        counts = [units for _, units in entries]
+        center = median(counts)
+        mad = median([abs(units - center) for units in counts]) or 1
+        limit = max(center + OUTLIER_THRESHOLD * mad, center * OUTLIER_MIN_RATIO)
+        for i, units in entries:
+            if units > limit and not reasons[i]:
+                warnings[i].append(
+                    f'unitCount {units} is far above the {property_type} median of {center:g}'
+                )
+
+    return reasons, warnings
+
+
+def main():
+    input_json = Path(sys.argv[1]) if len(sys.argv) > 1 else INPUT_JSON
+
+    zip_codes, bounds, state = load_geo_rules()
+    print(f"Loaded {len(zip_codes)} Jacksonville ZIP codes from {GEO_TS.name}")
+
+    with open(input_json) as f:
+        apartments = json.load(f)
+
+    print(f"Loaded {len(apartments)} apartments from {input_json.name}")
+
+    reasons, warnings = validate(apartments, zip_codes, bounds, state)
+
+    accepted = []
+    rejected = []
+    flagged = []
+    for apt, errors, notes in zip(apartments, reasons, warnings):
+        if errors:
+            record = apt if isinstance(apt, dict) else {'record': apt}
+            rejected.append({**record, 'rejection_reasons': errors})
+        else:
+            accepted.append(apt)
+            if notes:
+                flagged.append({**apt, 'warnings': notes})
+
+    for apt in rejected[:20]:  # Show first 20
+        print(f"  Rejected: {(apt.get('address') or '')[:30]:30} {'; '.join(apt['rejection_reasons'])}")
+    if len(rejected) > 20:
+        print(f"  ... and {len(rejected) - 20} more")
+
+    for apt in flagged[:20]:
+        print(f"  Flagged:  {(apt.get('address') or '')[:30]:30} {'; '.join(apt['warnings'])}")
+    if len(flagged) > 20:
+        print(f"  ... and {len(flagged) - 20} more")
+
+    print(f"\nAccepted: {len(accepted)} ({len(flagged)} flagged for review)")
+    print(f"Rejected: {len(rejected)}")
+
+    write_json(REJECTED_JSON, rejected)
+    write_json(FLAGGED_JSON, flagged)
+    write_json(OUTPUT_JSON, accepted)
+
+    print(f"Saved rejected records to: {REJECTED_JSON}")
+    print(f"Saved flagged records to: {FLAGGED_JSON}")
+    print(f"Saved validated records to: {OUTPUT_JSON}")
+    print(f"\nTo update the database, run:")
+    print(f"  npx tsx src/scripts/import-apartments.ts --file {OUTPUT_JSON.name}")
+
+if __name__ == '__main__':
+    main()